@@ -1,5 +1,5 @@
 import streamlit as st
-from src.data_handler import SessionTable
+from src.data_handler import get_session_table
 from src.file_operations import upload_file_section
 from src.shared_components import init_sidebar
 
@@ -12,7 +12,7 @@ st.set_page_config(
 
 # Initialize session table if not exists
 if "session_table" not in st.session_state:
-    st.session_state.session_table = SessionTable()
+    st.session_state.session_table = get_session_table()
 
 def main():
     st.title("📁 Upload Data")
@@ -32,9 +32,9 @@ def main():
     if original_data is not None:
         st.success("✅ File uploaded successfully!")
         
-        # Show data preview
+        # Show data preview (Arrow table skips the pandas->Arrow conversion)
         with st.expander("👁️ Data Preview", expanded=True):
-            st.dataframe(original_data.head(3))
+            st.dataframe(session_table.get_preview_arrow(rows=3))
         
         # Navigation button instead of info message
         if st.button("📊 Go to Data Overview", width="stretch", type="primary"):
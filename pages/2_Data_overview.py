@@ -1,9 +1,8 @@
 import streamlit as st
-from src.data_handler import SessionTable
+from src.data_handler import get_session_table
 from src.data_display import data_overview_section
 from src.country_selection import country_selection_section, confirm_selection_section
 from src.shared_components import init_sidebar
-from src.snowflake_handler import upload_dataframe_to_snowflake
 
 # Set page config
 st.set_page_config(
@@ -14,7 +13,7 @@ st.set_page_config(
 
 # Initialize session table if not exists
 if "session_table" not in st.session_state:
-    st.session_state.session_table = SessionTable()
+    st.session_state.session_table = get_session_table()
 
 
 def main():
@@ -2,6 +2,7 @@
 
 # Country selection constants
 COUNTRY_LIST = ["US", "UK", "DE", "FR", "IT"]
+COUNTRY_INDEX = {country: i for i, country in enumerate(COUNTRY_LIST)}
 
 # Validation constants
 REQUIRED_COLUMNS = ['ProductID', 'ItemID', 'ActualPrice', 'PromoPrice', 'StartDate', 'EndDate']
@@ -1,5 +1,14 @@
 import streamlit as st
-from src.config import COUNTRY_LIST
+from src.config import COUNTRY_LIST, COUNTRY_INDEX
+
+
+def _on_country_change():
+    """Persist the new widget selection when the dropdown actually changes"""
+    session_table = st.session_state.session_table
+    selected_country = st.session_state.get("country_selector")
+    session_table.set_selected_country(selected_country)
+    session_table.log_message(
+        f"Country selection changed to: {selected_country}")
 
 
 def country_selection_section():
@@ -18,25 +27,19 @@ def country_selection_section():
             current_country = ""
 
         # Ensure current country is valid
-        if current_country not in COUNTRY_LIST:
+        if current_country not in COUNTRY_INDEX:
             current_country = ""
 
         # Create country single select with current value as default
         selected_country = st.selectbox(
             "Select country for analysis:",
             options=COUNTRY_LIST,
-            index=COUNTRY_LIST.index(
-                current_country) if current_country in COUNTRY_LIST else None,
+            index=COUNTRY_INDEX.get(current_country),
             key="country_selector",
+            on_change=_on_country_change,
             help="Choose one country for data processing and analysis"
         )
 
-        # Update session if changed
-        if selected_country != current_country:
-            session_table.set_selected_country(selected_country)
-            session_table.log_message(
-                f"Country selection changed to: {selected_country}")
-
         return selected_country
 
 
@@ -1,6 +1,45 @@
+import re
+
+import numpy as np
+import pandas as pd
 import streamlit as st
 from src.data_handler import validate_data, prepare_display_data
 
+# Common datetime format patterns, precompiled once at import
+_DT_FORMAT_PATTERNS = (
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), 'yyyy-mm-dd'),
+    (re.compile(r'^\d{2}/\d{2}/\d{4}$'), 'mm/dd/yyyy'),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), 'm/d/yyyy'),
+    (re.compile(r'^\d{2}-\d{2}-\d{4}$'), 'mm-dd-yyyy'),
+    (re.compile(r'^\d{2}\.\d{2}\.\d{4}$'), 'mm.dd.yyyy'),
+    (re.compile(r'^\d{4}/\d{2}/\d{2}$'), 'yyyy/mm/dd'),
+    (re.compile(r'^\d{8}$'), 'yyyymmdd'),
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'), 'yyyy-mm-dd hh:mm:ss'),
+    (re.compile(r'^[A-Za-z]{3} \d{1,2}, \d{4}$'), 'Mon d, yyyy'),
+)
+
+_DT_FORMAT_NAMES = tuple(name for _, name in _DT_FORMAT_PATTERNS)
+
+# Rows per page when the user picks "All"; keeps the Arrow payload bounded
+TABLE_PAGE_SIZE = 5000
+
+# Fixed-width formats are fully determined by their digit/separator shape,
+# so most samples can be classified with a translate + dict lookup instead
+# of the regex sweep
+_DIGIT_SHAPE = str.maketrans('0123456789', 'dddddddddd')
+_SHAPE_TO_FORMAT = {
+    'dddd-dd-dd': 'yyyy-mm-dd',
+    'dd/dd/dddd': 'mm/dd/yyyy',
+    'd/d/dddd': 'm/d/yyyy',
+    'd/dd/dddd': 'm/d/yyyy',
+    'dd/d/dddd': 'm/d/yyyy',
+    'dd-dd-dddd': 'mm-dd-yyyy',
+    'dd.dd.dddd': 'mm.dd.yyyy',
+    'dddd/dd/dd': 'yyyy/mm/dd',
+    'dddddddd': 'yyyymmdd',
+    'dddd-dd-dd dd:dd:dd': 'yyyy-mm-dd hh:mm:ss',
+}
+
 
 def data_overview_section():
     """Main data overview section with consistent modal handling"""
@@ -31,18 +70,28 @@ def data_overview_section():
     st.header("📊 Data Overview")
 
     original_data = session_table.get_original_data()
-    selected_country = session_table.get_selected_country()
 
     if original_data is not None:
-        # Control bar
-        _render_control_bar(selected_country, session_table)
+        _overview_fragment(session_table)
+
+
+@st.fragment
+def _overview_fragment(session_table):
+    """Control bar and data table; dropdown changes rerun only this fragment"""
+    selected_country = session_table.get_selected_country()
+
+    # Control bar
+    _render_control_bar(selected_country, session_table)
 
-        # Display data table
-        _display_data_table(session_table)
+    # Display data table
+    _display_data_table(session_table)
 
 
 def _render_control_bar(selected_country, session_table):
     """Render the control bar with validation and view options"""
+    # Read session state once; the widgets below branch on it three times
+    validation_completed = session_table.is_validation_completed()
+
     col1, col2, col3, col4 = st.columns([2, 2, 2, 0.5])
 
     with col1:
@@ -51,10 +100,11 @@ def _render_control_bar(selected_country, session_table):
                 f"Validation button clicked for country: {selected_country}")
             with st.spinner(f"Validating entire dataset for {selected_country}..."):
                 validate_data()
-            st.rerun()
+            # Validation state feeds the sidebar and confirm section too
+            st.rerun(scope="app")
 
     with col2:
-        if session_table.is_validation_completed():
+        if validation_completed:
             view_filter = st.selectbox(
                 "View:",
                 ["All Rows", "Valid Only", "Invalid Only"],
@@ -72,7 +122,7 @@ def _render_control_bar(selected_country, session_table):
             )
 
     with col3:
-        if session_table.is_validation_completed():
+        if validation_completed:
             row_limit = st.selectbox(
                 "Show:",
                 [10, 25, 50, 100, "All"],
@@ -91,78 +141,96 @@ def _render_control_bar(selected_country, session_table):
         if st.button("🗑️", help="Clear all data"):
             session_table.log_message("Clear data button clicked")
             session_table.clear_all()
-            st.rerun()
+            st.rerun(scope="app")
 
 def detect_datetime_format(series):
     """Detect the datetime format from a pandas Series and return format string"""
+    # Already-parsed datetime columns need no string sampling
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'yyyy-mm-dd hh:mm:ss'
+
     if series.empty:
         return "Unknown"
     
-    # Filter out NaN values and get a sample
-    non_nan_values = series.dropna()
-    if len(non_nan_values) == 0:
+    # Sample from the head of the column only; we never need more than
+    # 10 values, so there is no reason to dropna() the whole Series
+    sample_values = series.iloc[:1000].dropna().head(10)
+    if len(sample_values) == 0:
         return "Unknown"
     
-    # Take a sample of values for format detection
-    sample_size = min(10, len(non_nan_values))
-    sample_values = non_nan_values.head(sample_size)
-    
-    # Common format patterns to detect
-    format_patterns = {
-        r'^\d{4}-\d{2}-\d{2}$': 'yyyy-mm-dd',
-        r'^\d{2}/\d{2}/\d{4}$': 'mm/dd/yyyy',
-        r'^\d{1,2}/\d{1,2}/\d{4}$': 'm/d/yyyy',
-        r'^\d{2}-\d{2}-\d{4}$': 'mm-dd-yyyy',
-        r'^\d{2}\.\d{2}\.\d{4}$': 'mm.dd.yyyy',
-        r'^\d{4}/\d{2}/\d{2}$': 'yyyy/mm/dd',
-        r'^\d{8}$': 'yyyymmdd',
-        r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$': 'yyyy-mm-dd hh:mm:ss',
-        r'^[A-Za-z]{3} \d{1,2}, \d{4}$': 'Mon d, yyyy',
-    }
-    
-    import re
-    string_values = sample_values.astype(str)
-    
-    # Count matches for each pattern
-    pattern_counts = {}
-    for pattern, format_name in format_patterns.items():
-        matches = sum(1 for val in string_values if re.match(pattern, val.strip()))
-        if matches > 0:
-            pattern_counts[format_name] = matches
-    
-    # Return the most common format
-    if pattern_counts:
-        most_common_format = max(pattern_counts.items(), key=lambda x: x[1])[0]
-        return most_common_format
-    
+    string_values = sample_values.astype(str).str.strip()
+
+    # Fast path: classify by digit/separator shape with a single lookup
+    shape_formats = string_values.str.translate(_DIGIT_SHAPE).map(_SHAPE_TO_FORMAT)
+    if shape_formats.notna().all():
+        shape_counts = shape_formats.value_counts()
+        if len(shape_counts) > 0:
+            return shape_counts.index[0]
+        return 'datetime'  # Generic fallback
+
+    # Count matches for each pattern with a vectorized str.match sweep,
+    # then pick the most common format with a single argmax
+    pattern_counts = np.fromiter(
+        (string_values.str.match(pattern).sum()
+         for pattern, _ in _DT_FORMAT_PATTERNS),
+        dtype=np.int64,
+        count=len(_DT_FORMAT_PATTERNS),
+    )
+    if pattern_counts.any():
+        return _DT_FORMAT_NAMES[pattern_counts.argmax()]
+
     return 'datetime'  # Generic fallback
 
+def _cached_datetime_format(series, col_name):
+    """Memoize per-column format detection across reruns of the same data"""
+    session_table = st.session_state.get("session_table")
+    if session_table is None:
+        return detect_datetime_format(series)
+
+    cache = st.session_state.setdefault("_date_format_cache", {})
+    key = (col_name, session_table.get_data_version())
+    if key not in cache:
+        if len(cache) > 64:
+            cache.clear()
+        cache[key] = detect_datetime_format(series)
+    return cache[key]
+
+
 def column_headers_for_dates(df):
     """Enhance column headers by adding format information for date columns"""
-    enhanced_df = df.copy()
-    new_columns = []
-    
     date_column_names = ['Start Date', 'End Date', 'StartDate', 'EndDate']
-    
+
+    mapping = {}
     for col in df.columns:
         if col in date_column_names:
             try:
                 if len(df[col].dropna()) > 0:
-                    detected_format = detect_datetime_format(df[col])
+                    detected_format = _cached_datetime_format(df[col], col)
                     if detected_format != 'Unknown':
-                        new_col_name = f"{col} ({detected_format})"
-                        new_columns.append(new_col_name)
-                    else:
-                        new_columns.append(col)
-                else:
-                    new_columns.append(col)
+                        mapping[col] = f"{col} ({detected_format})"
             except Exception:
-                new_columns.append(col)
-        else:
-            new_columns.append(col)
-    
-    enhanced_df.columns = new_columns
-    return enhanced_df
+                continue
+
+    if not mapping:
+        return df
+    # Relabel headers; Copy-on-Write keeps the underlying data shared
+    return df.rename(columns=mapping)
+
+
+def _filtered_row_count(session_table, view_filter):
+    """Row count for the active filter without materializing a frame"""
+    if not session_table.is_validation_completed():
+        original_data = session_table.get_original_data()
+        return 0 if original_data is None else len(original_data)
+    from src.data_handler import get_validation_stats
+    stats = get_validation_stats()
+    if stats is None:
+        return 0
+    if view_filter == "Valid Only":
+        return stats["valid"]
+    if view_filter == "Invalid Only":
+        return stats["invalid"]
+    return stats["total"]
 
 
 def _display_data_table(session_table):
@@ -171,20 +239,43 @@ def _display_data_table(session_table):
         view_filter = st.session_state.get("view_filter", "All Rows")
         row_limit = st.session_state.get("row_limit", 10)
 
-        display_df = prepare_display_data(view_filter, row_limit)
+        # "All" still renders a bounded page so Arrow serialization and
+        # the websocket payload stay O(page) regardless of dataset size
+        offset = 0
+        if row_limit == "All":
+            total_rows = _filtered_row_count(session_table, view_filter)
+            if total_rows > TABLE_PAGE_SIZE:
+                n_pages = -(-total_rows // TABLE_PAGE_SIZE)
+                # One widget per filter, clamped to the current page count,
+                # so a page persisted on another filter (or before a
+                # re-validation shrank the data) can't point past the end
+                page_key = f"table_page_{view_filter}"
+                if st.session_state.get(page_key, 1) > n_pages:
+                    st.session_state[page_key] = n_pages
+                page = st.number_input(
+                    f"Page (of {n_pages})",
+                    min_value=1,
+                    max_value=n_pages,
+                    value=1,
+                    key=page_key,
+                )
+                offset = (page - 1) * TABLE_PAGE_SIZE
+                row_limit = TABLE_PAGE_SIZE
+
+        display_df = prepare_display_data(view_filter, row_limit, offset)
         if display_df is not None:
             # Enhance column headers for date columns
             enhanced_df = column_headers_for_dates(display_df)
             
-            st.dataframe(enhanced_df)
+            st.dataframe(enhanced_df, use_container_width=True)
 
             selected_country = session_table.get_selected_country()
             if session_table.is_validation_completed():
                 st.caption(
-                    f"Showing {len(enhanced_df)} rows from {view_filter.lower()} for {selected_country}")
+                    f"Showing {enhanced_df.shape[0]} rows from {view_filter.lower()} for {selected_country}")
             else:
                 st.caption(
-                    f"Showing preview of first {len(enhanced_df)} rows for {selected_country}")
+                    f"Showing preview of first {enhanced_df.shape[0]} rows for {selected_country}")
         else:
             st.warning("No data to display")
     except Exception as e:
@@ -201,13 +292,12 @@ def show_debug_log():
 
     if logs:
         with st.expander("🔍 Debug Log", expanded=False):
-            for log_entry in logs:
-                if "ERROR" in log_entry:
-                    st.error(log_entry)
-                elif "WARNING" in log_entry:
-                    st.warning(log_entry)
-                else:
-                    st.text(log_entry)
+            # One element for the whole log instead of a widget per line;
+            # errors are surfaced once above the block
+            error_lines = [entry for entry in logs if "ERROR" in entry]
+            if error_lines:
+                st.error("\n\n".join(error_lines))
+            st.code("\n".join(logs), language="log")
 
             if st.button("🗑️ Clear Log", key="clear_log_btn"):
                 st.session_state.session_data["validation_log"] = []
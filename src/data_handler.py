@@ -1,9 +1,15 @@
+import os
+
 import streamlit as st
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+from types import MappingProxyType
 import logging
 
+from src.config import MAX_LOG_ENTRIES
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -11,34 +17,57 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Frozen template for the session state; built once at import so
+# constructing a SessionTable allocates nothing unless state is missing
+_DEFAULT_SESSION_STATE = MappingProxyType({
+    "original_data": None,
+    "original_data_arrow": None,  # Arrow preview slice, not the full frame
+    "original_parquet_path": None,  # Parquet staged at parse time for uploads
+    "validated_data": None,
+    "valid_mask": None,
+    "valid_idx": None,
+    "invalid_idx": None,
+    "validation_completed": False,
+    "file_info": None,
+    "validation_log": (),
+    "selected_country": "",
+    "confirmed_data": None,  # Note: This is no longer used but kept for structural consistency
+    "confirmation_completed": False, # Note: This is no longer used
+    "data_push_completed": False, # This was the missing key
+    "data_version": 0,  # Bumped whenever stored data changes
+})
+
+
 # Session table for temporal data storage
 class SessionTable:
     """Simple session table to store and manage temporal data"""
 
     def __init__(self):
+        self._log_buffer = []
         if "session_data" not in st.session_state:
             st.session_state.session_data = self._get_default_state()
 
-    def _get_default_state(self):
-        """Returns the default dictionary structure for the session state."""
-        return {
-            "original_data": None,
-            "validated_data": None,
-            "validation_completed": False,
-            "file_info": None,
-            "validation_log": [],
-            "selected_country": "",
-            "confirmed_data": None,  # Note: This is no longer used but kept for structural consistency
-            "confirmation_completed": False, # Note: This is no longer used
-            "data_push_completed": False, # This was the missing key
-        }
+    @staticmethod
+    def _get_default_state():
+        """Returns a fresh copy of the default session-state structure."""
+        state = dict(_DEFAULT_SESSION_STATE)
+        state["validation_log"] = []
+        return state
 
     def store_original_data(self, df, file_info):
         """Store original uploaded data"""
-        st.session_state.session_data["original_data"] = df.copy()
+        # Callers hand over ownership of df; storing by reference avoids a
+        # full memcpy per upload
+        st.session_state.session_data["original_data"] = df
+        st.session_state.session_data["original_data_arrow"] = None
+        self.discard_original_parquet()
         st.session_state.session_data["file_info"] = file_info
+        self._bump_data_version()
         # Reset validation when new data is uploaded
         st.session_state.session_data["validated_data"] = None
+        st.session_state.session_data["valid_mask"] = None
+        st.session_state.session_data["valid_idx"] = None
+        st.session_state.session_data["invalid_idx"] = None
         st.session_state.session_data["validation_completed"] = False
         st.session_state.session_data["confirmed_data"] = None
         st.session_state.session_data["confirmation_completed"] = False
@@ -48,8 +77,17 @@ class SessionTable:
 
     def store_validated_data(self, df):
         """Store validation results"""
-        st.session_state.session_data["validated_data"] = df.copy()
+        st.session_state.session_data["validated_data"] = df
+        # Precompute the validity mask and both index arrays once so
+        # display filters gather rows instead of re-filtering
+        mask = df["IsValid"].to_numpy()
+        st.session_state.session_data["valid_mask"] = mask
+        st.session_state.session_data["valid_idx"] = np.flatnonzero(
+            mask).astype(np.int32)
+        st.session_state.session_data["invalid_idx"] = np.flatnonzero(
+            ~mask).astype(np.int32)
         st.session_state.session_data["validation_completed"] = True
+        self._bump_data_version()
         # Reset confirmation when validation changes
         st.session_state.session_data["confirmed_data"] = None
         st.session_state.session_data["confirmation_completed"] = False
@@ -57,7 +95,7 @@ class SessionTable:
 
     def store_confirmed_data(self, df, country):
         """Store confirmed data for selected country"""
-        st.session_state.session_data["confirmed_data"] = df.copy()
+        st.session_state.session_data["confirmed_data"] = df
         st.session_state.session_data["confirmation_completed"] = True
         self.log_message(f"Confirmed data for country: {country}")
 
@@ -65,10 +103,73 @@ class SessionTable:
         """Get original data"""
         return st.session_state.session_data["original_data"]
 
+    def get_file_info(self):
+        """Get stored file metadata without touching the DataFrame"""
+        return st.session_state.session_data["file_info"]
+
+    def store_original_parquet_path(self, path):
+        """Remember the Parquet file staged at parse time for later uploads"""
+        self.discard_original_parquet()
+        st.session_state.session_data["original_parquet_path"] = path
+
+    def get_original_parquet_path(self):
+        """Get the parse-time Parquet path, or None if not staged"""
+        return st.session_state.session_data["original_parquet_path"]
+
+    def discard_original_parquet(self):
+        """Delete the parse-time Parquet file and forget its path"""
+        path = st.session_state.session_data.get("original_parquet_path")
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            st.session_state.session_data["original_parquet_path"] = None
+
+    def get_preview_arrow(self, rows=3):
+        """Get the first rows as a cached Arrow table for zero-copy display.
+
+        Only the preview slice is converted and kept; duplicating the
+        whole frame in Arrow would roughly double resident memory.
+        """
+        session_data = st.session_state.session_data
+        if session_data["original_data"] is None:
+            return None
+        cached = session_data.get("original_data_arrow")
+        if cached is None or cached.num_rows != rows:
+            import pyarrow as pa
+            cached = pa.Table.from_pandas(
+                session_data["original_data"].head(rows),
+                preserve_index=False)
+            session_data["original_data_arrow"] = cached
+        return cached
+
     def get_validated_data(self):
         """Get validated data"""
         return st.session_state.session_data["validated_data"]
 
+    def get_valid_mask(self):
+        """Get the precomputed boolean validity mask"""
+        return st.session_state.session_data.get("valid_mask")
+
+    def get_valid_idx(self):
+        """Get the precomputed positions of valid rows"""
+        return st.session_state.session_data.get("valid_idx")
+
+    def get_invalid_idx(self):
+        """Get the precomputed positions of invalid rows"""
+        return st.session_state.session_data.get("invalid_idx")
+
+    def get_data_version(self):
+        """Get the current data version (changes whenever stored data does)"""
+        return st.session_state.session_data.get("data_version", 0)
+
+    def _bump_data_version(self):
+        """Invalidate caches keyed on the data version"""
+        st.session_state.session_data["data_version"] = (
+            st.session_state.session_data.get("data_version", 0) + 1
+        )
+
     def get_confirmed_data(self):
         """Get confirmed data"""
         return st.session_state.session_data["confirmed_data"]
@@ -83,11 +184,12 @@ class SessionTable:
 
     def all_data_is_valid(self):
         """Check if ALL data is valid (no invalid rows)"""
+        valid_mask = self.get_valid_mask()
+        if valid_mask is not None:
+            return bool(valid_mask.all())
         validated_data = self.get_validated_data()
         if validated_data is not None:
-            invalid_count = len(
-                validated_data[validated_data["IsValid"] == False])
-            return invalid_count == 0
+            return bool(validated_data["IsValid"].to_numpy().all())
         return False
 
     def get_selected_country(self):
@@ -97,18 +199,17 @@ class SessionTable:
     def set_selected_country(self, country):
         """Store selected country"""
         current_country = st.session_state.session_data.get("selected_country", None)
-        
-        # Convert None to empty set for comparison
-        current_set = set() if current_country is None else set([current_country]) if isinstance(current_country, str) else set(current_country)
-        new_set = set() if country is None else set([country]) if isinstance(country, str) else set(country)
-        
-        if current_set != new_set:
-            st.session_state.session_data["selected_country"] = country
-            
-            if country is None:
-                self.log_message("Country selection cleared")
-            else:
-                self.log_message(f"Country set to: {country}")
+
+        # Selections are plain strings (or None), so compare directly
+        if current_country == country:
+            return
+
+        st.session_state.session_data["selected_country"] = country
+
+        if country is None:
+            self.log_message("Country selection cleared")
+        else:
+            self.log_message(f"Country set to: {country}")
 
     def set_data_push_completed(self):
         """Mark data push as completed"""
@@ -127,7 +228,11 @@ class SessionTable:
 
     def clear_all(self):
         """Clears all data from the session, resetting it to the initial state."""
+        current_version = st.session_state.session_data.get("data_version", 0)
+        self.discard_original_parquet()
         st.session_state.session_data = self._get_default_state()
+        # Keep the version monotonic so version-keyed caches stay invalid
+        st.session_state.session_data["data_version"] = current_version + 1
         self._clear_modal_states()
         self.log_message("Cleared all session data")
 
@@ -150,17 +255,47 @@ class SessionTable:
 
     def log_message(self, message, level="INFO"):
         """Add message to validation log"""
+        self._buffer_log(message, level)
+        self._flush_logs()
+
+    def log_batch(self, messages):
+        """Append several log entries with a single session-state flush.
+
+        Accepts plain strings or (message, level) tuples.
+        """
+        for entry in messages:
+            if isinstance(entry, tuple):
+                self._buffer_log(*entry)
+            else:
+                self._buffer_log(entry)
+        self._flush_logs()
+
+    def _buffer_log(self, message, level="INFO"):
+        """Queue a log message without touching session state"""
+        self._log_buffer.append((message, level))
+
+    def _flush_logs(self):
+        """Write all buffered messages to the session log in one batch"""
+        if not self._log_buffer:
+            return
+
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}"
-        st.session_state.session_data["validation_log"].append(log_entry)
-
-        # Also log to system
-        if level == "ERROR":
-            logger.error(message)
-        elif level == "WARNING":
-            logger.warning(message)
-        else:
-            logger.info(message)
+        logs = st.session_state.session_data["validation_log"]
+        for message, level in self._log_buffer:
+            logs.append(f"[{timestamp}] {level}: {message}")
+
+            # Also log to system
+            if level == "ERROR":
+                logger.error(message)
+            elif level == "WARNING":
+                logger.warning(message)
+            else:
+                logger.info(message)
+        self._log_buffer.clear()
+
+        # Bound session memory
+        if len(logs) > MAX_LOG_ENTRIES:
+            del logs[:-MAX_LOG_ENTRIES]
 
     def get_logs(self, limit=50):
         """Get recent log messages"""
@@ -168,12 +303,51 @@ class SessionTable:
         return logs[-limit:] if len(logs) > limit else logs
 
 
-# # Initialize session table
-session_table = SessionTable()
+@st.cache_resource
+def _build_session_table(session_id):
+    """Build one SessionTable per browser session (shared by reference, never copied)."""
+    return SessionTable()
+
+
+def get_session_table():
+    """Get the cached SessionTable singleton for the current session"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else "default"
+    return _build_session_table(session_id)
+
+
+def get_validation_stats():
+    """Validation counts for the sidebar, memoized per data version"""
+    session_table = get_session_table()
+    validated_data = session_table.get_validated_data()
+    if validated_data is None:
+        return None
+
+    stats_cache = st.session_state.setdefault("_stats_cache", {})
+    version = session_table.get_data_version()
+    stats = stats_cache.get(version)
+    if stats is None:
+        mask = session_table.get_valid_mask()
+        if mask is None:
+            mask = validated_data["IsValid"].to_numpy()
+        valid_count = int(mask.sum())
+        total_count = mask.size
+        stats = {
+            "valid": valid_count,
+            "invalid": total_count - valid_count,
+            "total": total_count,
+            "accuracy": valid_count / total_count * 100 if total_count > 0 else 0,
+        }
+        stats_cache.clear()
+        stats_cache[version] = stats
+    return stats
 
 
 def validate_data():
     """Validate the entire original dataset with vectorized validation"""
+    session_table = get_session_table()
     original_data = session_table.get_original_data()
     if original_data is None:
         session_table.log_message(
@@ -195,139 +369,188 @@ def validate_data():
             "End Date"
         ]
 
-        # Check if required columns exist
+        # Check if required columns exist (hashed set lookups)
+        existing_columns = set(original_data.columns)
         missing_columns = [
-            col for col in required_columns if col not in original_data.columns
+            col for col in required_columns if col not in existing_columns
         ]
 
         if missing_columns:
             error_msg = f"Missing required columns: {', '.join(missing_columns)}"
-            session_table.log_message(error_msg, "ERROR")
+            session_table._buffer_log(error_msg, "ERROR")
             st.error(f"❌ {error_msg}")
             return None
 
-        # Create validation copy
-        validation_df = original_data.copy()
-        validation_df["ValidationErrors"] = ""
-        validation_df["IsValid"] = True
-
-        # Vectorized validation functions
-        def validate_text_fields(df, columns):
-            """Validate text fields are not empty"""
-            errors = []
-            for col in columns:
-                mask = df[col].isna() | (df[col].astype(str).str.strip() == "")
-                errors.append((mask, f"Missing {col}"))
-            return errors
-
-        def validate_numeric(df, column, condition, error_msg):
-            """Validate numeric columns based on a condition"""
-            try:
-                # Convert to numeric, coerce errors to NaN
-                numeric_col = pd.to_numeric(df[column], errors='coerce')
-                # Create mask based on condition
-                mask = (~numeric_col.notnull()) | (~condition(numeric_col))
-                return [(mask, error_msg)]
-            except Exception:
-                # If conversion fails completely
-                return [(pd.Series([True]*len(df), index=df.index), f"Invalid {column}")]
-
-        # Collect all validation errors
-        all_errors = []
-
-        # Text field validation
-        text_fields = ["Category", "Item", "Density"]
-        all_errors.extend(validate_text_fields(validation_df, text_fields))
-
-        # Numeric validations with vectorized checks
-        all_errors.extend(validate_numeric(
-            validation_df,
-            "MSRP",
-            lambda x: x > 0,
-            "MSRP must be > 0"
-        ))
+        # Run the pure validation pass (cached on the frame's content hash,
+        # so re-validating an unchanged upload is a cache hit)
+        validation_df, validation_stats = _validate_df(original_data)
 
-        all_errors.extend(validate_numeric(
-            validation_df,
-            "PROMO",
-            lambda x: x >= 0,
-            "PROMO must be >= 0"
-        ))
-
-        all_errors.extend(validate_numeric(
-            validation_df,
-            "Discount",
-            lambda x: x <= 0,
-            "Discount should be <= 0"
-        ))
-
-        # Date validation
-        def validate_dates(df):
-            """Validate and compare dates"""
-            date_errors = []
-
-            # Parse dates
-            df['ParsedStartDate'] = pd.to_datetime(df['Start Date'], errors='coerce')
-            df['ParsedEndDate'] = pd.to_datetime(df['End Date'], errors='coerce')
-
-            # Invalid date parsing
-            date_errors.append((
-                df['ParsedStartDate'].isna(),
-                "Invalid Start Date"
-            ))
-            date_errors.append((
-                df['ParsedEndDate'].isna(),
-                "Invalid End Date"
-            ))
-
-            # Date comparison
-            date_errors.append((
-                df['ParsedStartDate'] >= df['ParsedEndDate'],
-                "Start Date must be before End Date"
-            ))
-
-            return date_errors
-
-        # Add date validation errors
-        all_errors.extend(validate_dates(validation_df))
-
-        # Apply validation errors
-        for error_mask, error_msg in all_errors:
-            # Accumulate errors for rows
-            validation_df.loc[error_mask, 'ValidationErrors'] = validation_df.loc[error_mask, 'ValidationErrors'].fillna('') + error_msg + '; '
-            validation_df.loc[error_mask, 'IsValid'] = False
-
-        # Clean up error strings
-        validation_df['ValidationErrors'] = validation_df['ValidationErrors'].str.rstrip('; ')
-
-        # Validation statistics
-        validation_stats = {
-            "total_rows": len(validation_df),
-            "valid_rows": sum(validation_df['IsValid']),
-            "invalid_rows": sum(~validation_df['IsValid']),
-            "error_types": {}
-        }
-
-        # Count error types
-        error_breakdown = validation_df[~validation_df['IsValid']]['ValidationErrors'].str.split('; ', expand=True).stack()
-        validation_stats['error_types'] = error_breakdown.value_counts().to_dict()
         # Store validation results
         session_table.store_validated_data(validation_df)
 
-        # Log validation summary
-        session_table.log_message(
+        # Log validation summary (buffered, flushed once below)
+        session_table._buffer_log(
             f"Validation completed - Valid: {validation_stats['valid_rows']}, Invalid: {validation_stats['invalid_rows']}"
         )
-        session_table.log_message(
+        session_table._buffer_log(
             f"Error breakdown: {validation_stats['error_types']}")
 
         return validation_df
 
     except Exception as e:
         error_msg = f"Critical validation error: {str(e)}"
-        session_table.log_message(error_msg, "ERROR")
+        session_table._buffer_log(error_msg, "ERROR")
         st.error(f"❌ Validation failed: {str(e)}")
         return None
+    finally:
+        session_table._flush_logs()
+
+
+def _hash_dataframe(df):
+    """Content hash for cache keys via the vectorized pandas hasher"""
+    return int(pd.util.hash_pandas_object(df, index=True).sum())
+
+
+@st.cache_data(
+    max_entries=4, show_spinner=False,
+    hash_funcs={pd.DataFrame: _hash_dataframe})
+def _validate_df(original_data):
+    """Pure validation pass; returns (validated frame, statistics dict)"""
+    # Create validation copy
+    validation_df = original_data.copy()
+
+    # Vectorized validation functions
+    def validate_text_fields(df, columns):
+        """Validate text fields are not empty (one fused pass over all columns)"""
+        block = df[columns].to_numpy(dtype=object)
+        na_mask = pd.isna(block)
+        stripped = np.char.strip(block.astype(str))
+        empty_mask = na_mask | (stripped == "")
+        return [
+            (empty_mask[:, k], f"Missing {col}")
+            for k, col in enumerate(columns)
+        ]
+
+    def validate_numeric(df, column, condition, error_msg):
+        """Validate numeric columns based on a condition"""
+        try:
+            # Already-numeric columns skip the coercing recast
+            if pd.api.types.is_numeric_dtype(df[column]):
+                numeric_col = df[column]
+            else:
+                numeric_col = pd.to_numeric(df[column], errors='coerce')
+            # Create mask based on condition
+            mask = (~numeric_col.notnull()) | (~condition(numeric_col))
+            return [(mask, error_msg)]
+        except Exception:
+            # If conversion fails completely
+            return [(pd.Series([True]*len(df), index=df.index), f"Invalid {column}")]
+
+    # Date validation
+    def validate_dates(df):
+        """Validate and compare dates"""
+        start_dates = _parse_mm_dd_series(df['Start Date'])
+        end_dates = _parse_mm_dd_series(df['End Date'])
+
+        return [
+            (start_dates.isna(), "Invalid Start Date"),
+            (end_dates.isna(), "Invalid End Date"),
+            (start_dates >= end_dates, "Start Date must be before End Date"),
+        ]
+
+    # Text field validation
+    text_fields = ["Category", "Item", "Density"]
+
+    # Each rule reads its own columns, so they can run concurrently
+    rule_jobs = [
+        lambda: validate_text_fields(validation_df, text_fields),
+        lambda: validate_numeric(
+            validation_df, "MSRP", lambda x: x > 0, "MSRP must be > 0"),
+        lambda: validate_numeric(
+            validation_df, "PROMO", lambda x: x >= 0, "PROMO must be >= 0"),
+        lambda: validate_numeric(
+            validation_df, "Discount", lambda x: x <= 0, "Discount should be <= 0"),
+        lambda: validate_dates(validation_df),
+    ]
+
+    # Collect all validation errors in rule order
+    all_errors = []
+    with ThreadPoolExecutor(max_workers=len(rule_jobs)) as executor:
+        for rule_errors in executor.map(lambda job: job(), rule_jobs):
+            all_errors.extend(rule_errors)
+
+    # Collapse the per-rule masks into one boolean error matrix, then
+    # build each invalid row's message with a single join instead of
+    # one full-column string concatenation per rule
+    error_messages = [msg for _, msg in all_errors]
+    error_matrix = np.column_stack(
+        [np.asarray(mask, dtype=bool) for mask, _ in all_errors])
+    invalid_mask = error_matrix.any(axis=1)
+
+    error_strings = np.full(len(validation_df), "", dtype=object)
+    invalid_pos = np.flatnonzero(invalid_mask)
+    if invalid_pos.size:
+        # Rule combinations repeat heavily across invalid rows, so join
+        # once per distinct combination and broadcast instead of running
+        # the Python join per row
+        combos, combo_codes = np.unique(
+            error_matrix[invalid_pos], axis=0, return_inverse=True)
+        combo_strings = np.array(
+            ["; ".join(error_messages[k] for k in np.flatnonzero(combo))
+             for combo in combos],
+            dtype=object,
+        )
+        error_strings[invalid_pos] = combo_strings[combo_codes]
+
+    # Error combinations repeat heavily, so store them as categorical
+    # codes plus one label table rather than a per-row Python string
+    validation_df['ValidationErrors'] = pd.Categorical(error_strings)
+    validation_df['IsValid'] = ~invalid_mask
+
+    # Validation statistics from one C-level reduction on the mask
+    total_rows = len(validation_df)
+    invalid_rows = int(invalid_mask.sum())
+    validation_stats = {
+        "total_rows": total_rows,
+        "valid_rows": total_rows - invalid_rows,
+        "invalid_rows": invalid_rows,
+        "error_types": {}
+    }
+
+    # Count error types straight off the error matrix
+    error_counts = error_matrix.sum(axis=0)
+    validation_stats['error_types'] = {
+        msg: int(count)
+        for msg, count in zip(error_messages, error_counts) if count
+    }
+
+    return validation_df, validation_stats
+
+
+def _parse_mm_dd_series(series):
+    """Parse a month-first date column with format-anchored C parsing"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    # Numeric columns are Excel serial day numbers (the sample promo file
+    # ships this way); stringifying them would coerce every row to NaT
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_datetime(
+            series, unit="D", origin="1899-12-30", errors="coerce")
+
+    # The allowed separators (/, -, .) all mean the same thing, so one
+    # anchored format covers them after normalization
+    normalized = series.astype(str).str.strip().str.replace(
+        r'[-.]', '/', regex=True)
+    parsed = pd.to_datetime(normalized, format='%m/%d/%Y', errors='coerce')
+
+    # Second pass only for the leftovers (two-digit years, trailing times)
+    remaining = parsed.isna()
+    if remaining.any():
+        parsed.loc[remaining] = pd.to_datetime(
+            normalized[remaining], format='mixed',
+            dayfirst=False, errors='coerce')
+    return parsed
 
 
 def parse_mm_dd_yyyy(date_value):
@@ -338,36 +561,16 @@ def parse_mm_dd_yyyy(date_value):
     if pd.isna(date_value) or str(date_value).strip() == '':
         return None, "Empty date value"
 
-    # Define the allowed date formats (month first)
-    mm_dd_yyyy_formats = [
-        '%m/%d/%Y',  # 12/31/2023
-        '%m-%d-%Y',  # 12-31-2023
-        '%m.%d.%Y',  # 12.31.2023
-        '%m/%d/%y',  # 12/31/23
-        '%m-%d-%y',  # 12-31-23
-        '%m.%d.%y',   # 12.31.23
-        '%m/%d/%Y %H:%M:%S',
-        '%m-%d-%Y %H:%M:%S',
-    ]
-
-    # Attempt to parse the date using the allowed formats
-    for fmt in mm_dd_yyyy_formats:
-        try:
-            # On non-Windows platforms, we can use %-m and %-d for non-padded month/day
-            # but for cross-platform compatibility, we will rely on pandas' flexibility
-            parsed_date = pd.to_datetime(date_value, format=fmt, errors='raise')
-            if not pd.isna(parsed_date):
-                return parsed_date, None
-        except (ValueError, TypeError):
-            continue
-    
-    # If all formats fail, return an error
-    return None, f"Invalid date format: '{date_value}'. Please use MM/DD/YYYY."
+    parsed_date = _parse_mm_dd_series(pd.Series([date_value])).iloc[0]
+    if pd.isna(parsed_date):
+        return None, f"Invalid date format: '{date_value}'. Please use MM/DD/YYYY."
+    return parsed_date, None
 
 
 
-def prepare_display_data(view_filter, row_limit):
+def prepare_display_data(view_filter, row_limit, offset=0):
     """Prepare data for display based on filters"""
+    session_table = get_session_table()
     try:
         if not session_table.is_validation_completed():
             # Show preview of original data
@@ -375,10 +578,11 @@ def prepare_display_data(view_filter, row_limit):
             if original_data is not None:
                 limit = int(row_limit) if row_limit != "All" else len(
                     original_data)
-                display_df = original_data.head(limit)
+                # iloc slicing returns a view rather than a head() copy
+                display_df = original_data.iloc[offset:offset + limit]
 
                 display_df = display_df.reset_index(drop=True)
-                display_df.index = display_df.index + 1
+                display_df.index = display_df.index + 1 + offset
                 return display_df
             return None
 
@@ -387,21 +591,40 @@ def prepare_display_data(view_filter, row_limit):
         if validated_data is None:
             return None
 
-        # Add status column
-        display_df = validated_data.copy()
-        display_df["Status"] = display_df.apply(
-            lambda row: "✅" if row["IsValid"] else "❌", axis=1
-        )
+        # Reuse the prepared frame while the filters and data are unchanged
+        display_cache = st.session_state.setdefault("_display_cache", {})
+        cache_key = (
+            view_filter, row_limit, offset, session_table.get_data_version())
+        if cache_key in display_cache:
+            return display_cache[cache_key]
+
+        # Resolve the shown row positions first so only that slice is ever
+        # materialized, instead of copying and filtering the full frame
+        valid_mask = session_table.get_valid_mask()
+        if valid_mask is None:
+            valid_mask = validated_data["IsValid"].to_numpy()
 
-        # Filter based on validation status
         if view_filter == "Valid Only":
-            display_df = display_df[display_df["IsValid"] == True]
+            shown_idx = session_table.get_valid_idx()
+            if shown_idx is None:
+                shown_idx = np.flatnonzero(valid_mask)
         elif view_filter == "Invalid Only":
-            display_df = display_df[display_df["IsValid"] == False]
+            shown_idx = session_table.get_invalid_idx()
+            if shown_idx is None:
+                shown_idx = np.flatnonzero(~valid_mask)
+        else:
+            shown_idx = np.arange(len(validated_data))
 
-        # Apply row limit
+        # Apply pagination window
         if row_limit != "All":
-            display_df = display_df.head(int(row_limit))
+            shown_idx = shown_idx[offset:offset + int(row_limit)]
+        elif offset:
+            shown_idx = shown_idx[offset:]
+
+        # assign() sizes the new frame by the shown slice and adds the
+        # vectorized Status column in the same step, no full-frame copy
+        display_df = validated_data.iloc[shown_idx].assign(
+            Status=np.where(valid_mask[shown_idx], "✅", "❌"))
 
         # Reorder columns
         data_columns = [
@@ -416,12 +639,18 @@ def prepare_display_data(view_filter, row_limit):
             view_filter in ["Invalid Only", "All Rows"]
             and "ValidationErrors" in display_df.columns
         ):
-            if not display_df["ValidationErrors"].str.strip().eq("").all():
+            # Any invalid row implies a non-empty error string; the cached
+            # mask answers that without scanning the string column
+            if not valid_mask.all():
                 column_order.append("ValidationErrors")
 
         final_df = display_df[column_order]
         final_df = final_df.reset_index(drop=True)
-        final_df.index = final_df.index + 1
+        final_df.index = final_df.index + 1 + offset
+
+        if len(display_cache) > 16:
+            display_cache.clear()
+        display_cache[cache_key] = final_df
 
         return final_df
 
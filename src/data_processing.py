@@ -19,8 +19,12 @@ def confirm_country_selection(country):
             st.error("❌ No validated data available")
             return
 
-        # Filter for valid data only
-        valid_data = validated_data[validated_data["IsValid"] == True].copy()
+        # Filter with the cached numpy mask: skips the Series-wrapped
+        # comparison and its index alignment
+        mask = session_table.get_valid_mask()
+        if mask is None:
+            mask = validated_data["IsValid"].to_numpy(dtype=bool, copy=False)
+        valid_data = validated_data.iloc[mask]
         if len(valid_data) == 0:
             st.error("❌ No valid rows found in the dataset")
             return
@@ -1,7 +1,277 @@
+import io
+import os
+import tempfile
+
 import streamlit as st
 import pandas as pd
+from src.config import LARGE_FILE_THRESHOLD
 from src.data_handler import SessionTable
 
+# Rows per chunk when streaming large CSVs
+CSV_CHUNK_SIZE = 256_000
+
+# On-disk parse cache keeps this many Parquet files, oldest evicted first
+PARSE_CACHE_MAX_FILES = 4
+
+# Hash upload bytes with xxhash when installed; it is far faster than the
+# default hasher on large files
+try:
+    import xxhash
+    _UPLOAD_HASH_FUNCS = {bytes: lambda b: xxhash.xxh3_64(b).intdigest()}
+except ImportError:
+    xxhash = None
+    _UPLOAD_HASH_FUNCS = None
+
+
+def _upload_fingerprint(uploaded_file):
+    """Cheap content fingerprint: first and last 64 KB plus the size.
+
+    Distinguishes an edited re-upload under the same name from a plain
+    rerun without hashing the whole file.
+    """
+    buffer = uploaded_file.getbuffer()
+    payload = (
+        bytes(buffer[:65536])
+        + bytes(buffer[-65536:])
+        + str(uploaded_file.size).encode()
+    )
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(payload)
+    import hashlib
+    return hashlib.md5(payload).hexdigest()
+
+
+def _fast_io_enabled():
+    """Check the optional fast_io secret that gates the Polars/PyArrow path"""
+    try:
+        return bool(st.secrets.get("fast_io", True))
+    except Exception:
+        return True
+
+
+def _read_csv_fast(raw_bytes):
+    """Read CSV via the multithreaded Polars or PyArrow parsers when installed.
+
+    Returns None when neither parser can produce clean string columns, so
+    the caller falls back to the tolerant pandas reader.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+    if pl is not None:
+        try:
+            return pl.read_csv(io.BytesIO(raw_bytes)).to_pandas()
+        except Exception:
+            pass  # malformed input; try the next reader
+
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return None
+    try:
+        table = pa_csv.read_csv(
+            io.BytesIO(raw_bytes),
+            read_options=pa_csv.ReadOptions(block_size=16 << 20, use_threads=True),
+        )
+    except Exception:
+        return None
+    # Non-UTF-8 bytes make Arrow infer binary columns, which downstream
+    # string handling chokes on; let pandas decode with replacement chars
+    if any(
+        pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)
+        for field in table.schema
+    ):
+        return None
+    # split_blocks + self_destruct hand the Arrow buffers to pandas
+    # without a second full-table copy
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _optimize_dtypes(df):
+    """Downcast numerics and categorize low-cardinality strings to cut memory"""
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_float_dtype(series):
+            df[col] = pd.to_numeric(series, downcast="float")
+        elif pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast="integer")
+        elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+            if series.nunique(dropna=True) / max(len(series), 1) < 0.5:
+                df[col] = series.astype("category")
+            elif series.dtype == object:
+                # Arrow-backed strings keep contiguous UTF-8 buffers, so the
+                # validation string kernels skip per-object dispatch; pandas 3
+                # StringDtype columns are Arrow-backed already
+                try:
+                    df[col] = series.astype("string[pyarrow]")
+                except (ImportError, TypeError, UnicodeDecodeError):
+                    pass
+    return df
+
+
+def _infer_csv_dtypes(raw_bytes):
+    """Build a dtype map from a 1000-row sample so the full parse can skip
+    whole-column inference for low-cardinality string columns."""
+    try:
+        sample = pd.read_csv(io.BytesIO(raw_bytes), nrows=1000)
+    except Exception:
+        return None
+
+    dtypes = {}
+    for col in sample.columns:
+        series = sample[col]
+        # Numeric columns are left to the parser: a sample can't prove a
+        # narrower type holds for the remaining rows. String columns are
+        # object on pandas 2 and StringDtype on pandas 3
+        if series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+            if series.nunique(dropna=True) / max(len(series), 1) < 0.05:
+                dtypes[col] = "category"
+    return dtypes or None
+
+
+def _read_upload(raw_bytes, file_name, file_size_mb):
+    """Dispatch uploaded bytes to the appropriate reader."""
+    if file_name.endswith(".csv"):
+        if _fast_io_enabled():
+            df = _read_csv_fast(raw_bytes)
+            if df is not None:
+                return df
+        dtypes = _infer_csv_dtypes(raw_bytes)
+        if file_size_mb > LARGE_FILE_THRESHOLD:
+            # Stream large files in chunks to bound peak parser memory
+            with pd.read_csv(
+                io.BytesIO(raw_bytes),
+                chunksize=CSV_CHUNK_SIZE,
+                dtype=dtypes,
+                low_memory=False,
+                cache_dates=True,
+                encoding_errors="replace",
+            ) as reader:
+                return pd.concat(reader, ignore_index=True)
+        # encoding_errors avoids a full re-parse when a stray non-UTF-8
+        # byte would otherwise raise UnicodeDecodeError
+        return pd.read_csv(
+            io.BytesIO(raw_bytes),
+            engine="c",
+            dtype=dtypes,
+            low_memory=False,
+            cache_dates=True,
+            encoding_errors="replace",
+        )
+    return _read_excel(raw_bytes)
+
+
+def _read_excel(raw_bytes):
+    """Read Excel bytes without building a full openpyxl DOM when possible"""
+    # calamine is a streaming Rust reader, much faster and lighter than
+    # default openpyxl
+    try:
+        return pd.read_excel(io.BytesIO(raw_bytes), engine="calamine")
+    except (ImportError, ValueError):
+        pass
+
+    # openpyxl read-only mode streams rows instead of building the DOM
+    try:
+        from openpyxl import load_workbook
+        workbook = load_workbook(
+            io.BytesIO(raw_bytes), read_only=True, data_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is not None:
+            return pd.DataFrame(rows, columns=header)
+    except Exception:
+        pass
+
+    return pd.read_excel(io.BytesIO(raw_bytes))
+
+
+def _parse_cache_path(fingerprint):
+    """Path of the on-disk Parquet cache for an upload fingerprint"""
+    return os.path.join(
+        tempfile.gettempdir(), "pis_parse_cache", f"{fingerprint}.parquet")
+
+
+def _load_parse_cache(fingerprint):
+    """Reload a previously parsed upload from disk, or None on miss.
+
+    Survives server restarts and session timeouts, when the in-process
+    st.cache_data entries are gone.
+    """
+    path = _parse_cache_path(fingerprint)
+    try:
+        if os.path.exists(path):
+            df = pd.read_parquet(path)
+            # Refresh the mtime so eviction drops least-recently-used files
+            os.utime(path, None)
+            return df
+    except Exception:
+        pass
+    return None
+
+
+def _save_parse_cache(fingerprint, df):
+    """Persist the parsed frame so the same file never parses twice"""
+    path = _parse_cache_path(fingerprint)
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(path, engine="pyarrow", compression="zstd")
+
+        # Bound the cache like its in-process counterparts: keep the
+        # most recently used files, evict the rest
+        entries = sorted(
+            (os.path.getmtime(entry), entry)
+            for entry in (
+                os.path.join(cache_dir, name)
+                for name in os.listdir(cache_dir)
+            )
+        )
+        for _, stale_path in entries[:-PARSE_CACHE_MAX_FILES]:
+            try:
+                os.unlink(stale_path)
+            except OSError:
+                pass
+    except Exception:
+        pass
+
+
+def _stage_parquet(df):
+    """Serialize the parsed frame to a zstd Parquet file for later PUT.
+
+    Writing the file once at parse time lets the Snowflake push skip the
+    pandas-to-Parquet round-trip entirely and stream the same bytes to
+    the stage. Returns the file path, or None when pyarrow is missing.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    try:
+        # Column names are normalized now so the staged file matches the
+        # Snowflake table schema without rewriting
+        from src.snowflake_handler import _normalize_upload_columns
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.rename_columns(
+            _normalize_upload_columns(table.column_names))
+        handle = tempfile.NamedTemporaryFile(
+            prefix="upload_stage_", suffix=".parquet", delete=False)
+        handle.close()
+        pq.write_table(
+            table, handle.name, compression="zstd", compression_level=3,
+            use_dictionary=True, write_statistics=False)
+        return handle.name
+    except Exception:
+        return None
+
+
+@st.cache_data(max_entries=4, show_spinner=False, hash_funcs=_UPLOAD_HASH_FUNCS)
+def _parse_upload(raw_bytes, file_name, file_size_mb):
+    """Parse uploaded file bytes into a DataFrame (cached across reruns)."""
+    return _optimize_dtypes(_read_upload(raw_bytes, file_name, file_size_mb))
+
 
 def upload_file_section():
     """Handle file upload"""
@@ -15,18 +285,26 @@ def upload_file_section():
 
     if uploaded_file is not None:
         file_size_mb = uploaded_file.size / 1024 / 1024
-        file_info = {"name": uploaded_file.name, "size_mb": file_size_mb}
-        session_table.log_message(
-            f"File uploaded: {uploaded_file.name} ({file_size_mb:.2f} MB)"
-        )
+        fingerprint = _upload_fingerprint(uploaded_file)
+        file_info = {
+            "name": uploaded_file.name,
+            "size_mb": file_size_mb,
+            "fingerprint": fingerprint,
+        }
 
-        # Check if this is a new file
-        current_file_info = session_table.get_original_data()
+        # Compare the content fingerprint before doing any work: on reruns
+        # with a sticky uploader the same file stays in the widget, while
+        # an edited file under the same name still invalidates
+        current_file_info = session_table.get_file_info()
         if (
             current_file_info is None
-            or st.session_state.session_data["file_info"] is None
-            or st.session_state.session_data["file_info"]["name"] != uploaded_file.name
+            or current_file_info.get("fingerprint") != fingerprint
         ):
+            # Collected locally and flushed once; each flush rewrites the
+            # session-state log list
+            pending_logs = [
+                f"File uploaded: {uploaded_file.name} ({file_size_mb:.2f} MB)"
+            ]
             loading_msg = (
                 "🔄 Processing large file..."
                 if file_size_mb > 10
@@ -35,30 +313,39 @@ def upload_file_section():
 
             with st.spinner(loading_msg):
                 try:
-                    # Parse file
-                    if uploaded_file.name.endswith(".csv"):
-                        df = pd.read_csv(
-                            uploaded_file,
-                            low_memory=False if file_size_mb > 5 else True,
-                        )
-                        session_table.log_message(
-                            "CSV file parsed successfully")
+                    # The on-disk Parquet cache outlives server restarts;
+                    # the in-process cache below covers reruns
+                    df = _load_parse_cache(fingerprint)
+                    if df is not None:
+                        pending_logs.append(
+                            "File restored from parse cache")
                     else:
-                        df = pd.read_excel(uploaded_file)
-                        session_table.log_message(
-                            "Excel file parsed successfully")
+                        raw_bytes = uploaded_file.getvalue()
+                        df = _parse_upload(
+                            raw_bytes, uploaded_file.name, file_size_mb)
+                        if uploaded_file.name.endswith(".csv"):
+                            pending_logs.append("CSV file parsed successfully")
+                        else:
+                            pending_logs.append(
+                                "Excel file parsed successfully")
+                        _save_parse_cache(fingerprint, df)
 
                     # Store in session table
                     session_table.store_original_data(df, file_info)
-                    session_table.log_message(
+                    parquet_path = _stage_parquet(df)
+                    if parquet_path is not None:
+                        session_table.store_original_parquet_path(parquet_path)
+                    pending_logs.append(
                         f"Data loaded: {len(df)} rows, {len(df.columns)} columns"
                     )
+                    session_table.log_batch(pending_logs)
 
                     # Trigger rerun to update UI
                     st.rerun()
                 except Exception as e:
                     error_msg = f"File upload error: {str(e)}"
-                    session_table.log_message(error_msg, "ERROR")
+                    pending_logs.append((error_msg, "ERROR"))
+                    session_table.log_batch(pending_logs)
                     st.error(f"❌ Error: {str(e)}")
                     return None
             return session_table.get_original_data()
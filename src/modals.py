@@ -1,5 +1,4 @@
 import streamlit as st
-from src.snowflake_handler import upload_original_data_to_snowflake
 
 def initialize_modal_states():
     """Initialize modal-related session state variables."""
@@ -51,6 +50,8 @@ def show_processing_modal():
     st.write("This process may take a few minutes. Please do not close this window.")
     
     with st.spinner("Connecting and uploading data to Snowflake..."):
+        # Lazy import: the Snowflake connector is heavy and only needed here
+        from src.snowflake_handler import upload_original_data_to_snowflake
         session_table = st.session_state.session_table
         # Call the main upload function
         upload_result = upload_original_data_to_snowflake(session_table)
@@ -7,21 +7,15 @@ def sidebar_info_fragment():
     session_table = st.session_state.session_table
 
     if session_table.is_validation_completed():
-        validated_data = session_table.get_validated_data()
-        if validated_data is not None:
-            valid_count = len(
-                validated_data[validated_data["IsValid"] == True])
-            invalid_count = len(
-                validated_data[validated_data["IsValid"] == False])
-            total_count = len(validated_data)
-            accuracy = valid_count / total_count * 100 if total_count > 0 else 0
-
+        from src.data_handler import get_validation_stats
+        stats = get_validation_stats()
+        if stats is not None:
             st.header("📊 Data Quality")
 
-            st.metric("✅ Valid Rows", valid_count)
-            st.metric("❌ Invalid Rows", invalid_count)
-            st.metric("📊 Total Rows", total_count)
-            st.metric("🎯 Quality Score", f"{accuracy:.1f}%")
+            st.metric("✅ Valid Rows", stats["valid"])
+            st.metric("❌ Invalid Rows", stats["invalid"])
+            st.metric("📊 Total Rows", stats["total"])
+            st.metric("🎯 Quality Score", f"{stats['accuracy']:.1f}%")
 
             # Show selected country if available
             selected_country = session_table.get_selected_country()
@@ -39,8 +33,8 @@ def init_sidebar():
     """Initialize sidebar for any page - call this in every page"""
     # Initialize session table if not exists
     if "session_table" not in st.session_state:
-        from src.data_handler import SessionTable
-        st.session_state.session_table = SessionTable()
+        from src.data_handler import get_session_table
+        st.session_state.session_table = get_session_table()
 
     # Render sidebar content
     with st.sidebar:
@@ -19,28 +19,17 @@ def validation_statistics_fragment():
     session_table = st.session_state.session_table
 
     if session_table.is_validation_completed():
-        validated_data = session_table.get_validated_data()
-        if validated_data is not None:
-            valid_count = len(
-                validated_data[validated_data["IsValid"] == True])
-            invalid_count = len(
-                validated_data[validated_data["IsValid"] == False])
-            total_count = len(validated_data)
-            accuracy = valid_count / total_count * 100 if total_count > 0 else 0
+        from src.data_handler import get_validation_stats
+        stats = get_validation_stats()
+        if stats is not None:
+            # Divide once; both deltas reuse the factor
+            pct_per_row = 100.0 / stats["total"] if stats["total"] > 0 else 0.0
+            valid_pct = f"{stats['valid'] * pct_per_row:.1f}%"
+            invalid_pct = f"{stats['invalid'] * pct_per_row:.1f}%"
 
             st.sidebar.header("📊 Data Quality")
 
-            st.sidebar.metric(
-                "✅ Valid Rows",
-                valid_count,
-                f"{valid_count/total_count*100:.1f}%" if total_count > 0 else "0%"
-            )
-
-            st.sidebar.metric(
-                "❌ Invalid Rows",
-                invalid_count,
-                f"{invalid_count/total_count*100:.1f}%" if total_count > 0 else "0%"
-            )
-
-            st.sidebar.metric("📊 Total Rows", total_count)
-            st.sidebar.metric("🎯 Data Quality", f"{accuracy:.1f}%")
+            st.sidebar.metric("✅ Valid Rows", stats["valid"], valid_pct)
+            st.sidebar.metric("❌ Invalid Rows", stats["invalid"], invalid_pct)
+            st.sidebar.metric("📊 Total Rows", stats["total"])
+            st.sidebar.metric("🎯 Data Quality", f"{stats['accuracy']:.1f}%")
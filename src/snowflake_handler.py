@@ -1,37 +1,109 @@
-import streamlit as st
-import snowflake.connector
+import os
+import shutil
+import tempfile
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from snowflake.connector.pandas_tools import write_pandas
+
+import streamlit as st
+
+# Rows per Parquet part file and PUT concurrency for large uploads
+UPLOAD_PART_ROWS = 250_000
+UPLOAD_MAX_PARALLEL_PUTS = 8
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+@st.cache_resource(show_spinner=False)
+def _open_snowflake_connection():
+    """Open one keep-alive Snowflake connection, shared across uploads."""
+    # Imported here so pages that merely import this module don't pay the
+    # connector's several-hundred-ms import cost
+    import snowflake.connector
+
+    conn = snowflake.connector.connect(
+        user=st.secrets["snowflake"]["user"],
+        password=st.secrets["snowflake"]["programmatic_access_token"],
+        account=st.secrets["snowflake"]["account"],
+        warehouse=st.secrets["snowflake"]["warehouse"],
+        database=st.secrets["snowflake"]["database"],
+        schema=st.secrets["snowflake"]["schema"],
+        role=st.secrets["snowflake"]["role"],
+        client_session_keep_alive=True,
+    )
+    logger.info("Successfully connected to Snowflake.")
+    return conn
+
+
 def get_snowflake_connection():
-    """Establishes a Snowflake connection."""
+    """Returns the cached Snowflake connection, reconnecting if it went stale."""
     try:
-        conn = snowflake.connector.connect(
-            user=st.secrets["snowflake"]["user"],
-            password=st.secrets["snowflake"]["programmatic_access_token"],
-            account=st.secrets["snowflake"]["account"],
-            warehouse=st.secrets["snowflake"]["warehouse"],
-            database=st.secrets["snowflake"]["database"],
-            schema=st.secrets["snowflake"]["schema"],
-            role=st.secrets["snowflake"]["role"]
-        )
-        logger.info("Successfully connected to Snowflake.")
+        conn = _open_snowflake_connection()
+        if conn.is_closed():
+            # Session expired; drop the cached handle and reconnect once
+            _open_snowflake_connection.clear()
+            conn = _open_snowflake_connection()
         return conn
     except Exception as e:
         logger.error(f"Error connecting to Snowflake: {e}")
         st.error(f"Error connecting to Snowflake: {e}")
         return None
 
+def _normalize_upload_columns(columns):
+    """Upper-case column names with spaces and dashes as underscores."""
+    return [col.replace(' ', '_').replace('-', '_').upper() for col in columns]
+
+
+def _snowflake_type(arrow_type):
+    """Map an Arrow field type to the matching Snowflake column type."""
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pa.types.is_boolean(arrow_type):
+        return "BOOLEAN"
+    if pa.types.is_integer(arrow_type):
+        return "NUMBER"
+    if pa.types.is_floating(arrow_type):
+        return "FLOAT"
+    if pa.types.is_timestamp(arrow_type):
+        return "TIMESTAMP_NTZ"
+    if pa.types.is_date(arrow_type):
+        return "DATE"
+    return "VARCHAR"
+
+
+def _write_parquet_part(table, part_index, part_rows, temp_dir):
+    """Write one zstd Parquet part file and return its path."""
+    import pyarrow.parquet as pq
+
+    path = os.path.join(temp_dir, f"part_{part_index:04d}.parquet")
+    pq.write_table(
+        table.slice(part_index * part_rows, part_rows), path,
+        compression="zstd", compression_level=3,
+        use_dictionary=True, write_statistics=False)
+    return path
+
+
+def _put_file(conn, path, table_name):
+    """PUT one staged file on its own cursor (cursors are not thread-safe)."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            f"PUT file://{path} @%{table_name} "
+            "AUTO_COMPRESS=FALSE SOURCE_COMPRESSION=ZSTD PARALLEL=4")
+    finally:
+        cursor.close()
+
+
 def upload_dataframe_to_snowflake(df, table_name, session_table=None):
     """
-    Uploads a DataFrame to Snowflake using the efficient write_pandas method.
+    Uploads a DataFrame to Snowflake by staging a zstd Parquet file and
+    running COPY INTO, which is much cheaper than CSV staging.
     """
     conn = None
+    parquet_dir = None
     try:
         conn = get_snowflake_connection()
         if conn is None:
@@ -39,26 +111,121 @@ def upload_dataframe_to_snowflake(df, table_name, session_table=None):
                 session_table.log_message("Failed to connect to Snowflake", "ERROR")
             return False
 
-        df_to_upload = df.copy()
-        df_to_upload.columns = [col.replace(' ', '_').replace('-', '_').upper() for col in df.columns]
+        # rename shares the underlying blocks under Copy-on-Write
+        df_to_upload = df.rename(
+            columns=dict(zip(df.columns, _normalize_upload_columns(df.columns))))
 
-        success, nchunks, nrows, _ = write_pandas(
-            conn=conn,
-            df=df_to_upload,
-            table_name=table_name,
-            auto_create_table=True,
-            overwrite=False
-        )
-        
-        return success
+        # Compact dtypes before serialization: category/Arrow-backed string
+        # columns take pyarrow's zero-copy path into Parquet
+        from src.file_operations import _optimize_dtypes
+        df_to_upload = _optimize_dtypes(df_to_upload)
+
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df_to_upload, preserve_index=False)
+        n_parts = max(1, min(UPLOAD_MAX_PARALLEL_PUTS,
+                             -(-table.num_rows // UPLOAD_PART_ROWS)))
+        part_rows = -(-table.num_rows // n_parts)
+
+        cursor = conn.cursor()
+        try:
+            columns_ddl = ", ".join(
+                f'"{field.name}" {_snowflake_type(field.type)}'
+                for field in table.schema
+            )
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_ddl})")
+        finally:
+            cursor.close()
+
+        # Pipeline compression against the network: each part's PUT is
+        # submitted as soon as the file is written, so later parts compress
+        # while earlier ones are in flight; one COPY then ingests all parts
+        parquet_dir = tempfile.mkdtemp(prefix="sf_upload_")
+        with ThreadPoolExecutor(
+            max_workers=min(UPLOAD_MAX_PARALLEL_PUTS, n_parts)
+        ) as executor:
+            futures = []
+            for i in range(n_parts):
+                path = _write_parquet_part(table, i, part_rows, parquet_dir)
+                futures.append(
+                    executor.submit(_put_file, conn, path, table_name))
+            for future in futures:
+                future.result()
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"COPY INTO {table_name} "
+                "FILE_FORMAT=(TYPE=PARQUET) "
+                "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE PURGE=TRUE")
+        finally:
+            cursor.close()
+
+        return True
 
     except Exception as e:
         logger.error(f"Error during Snowflake upload: {str(e)}")
+        # A dead session should not stay cached for the next attempt
+        if conn is not None and conn.is_closed():
+            _open_snowflake_connection.clear()
         # Re-raise the exception so the calling function can handle it
         raise e
     finally:
-        if conn:
-            conn.close()
+        # The connection is cached and reused; only the temp files go away
+        if parquet_dir:
+            shutil.rmtree(parquet_dir, ignore_errors=True)
+
+def upload_staged_parquet_to_snowflake(parquet_path, table_name,
+                                       selected_country, session_table=None):
+    """
+    Pushes a Parquet file staged at parse time: PUT the existing file and
+    COPY it, skipping the pandas-to-Parquet round-trip. The selected
+    country is appended server-side with one set-based UPDATE.
+    """
+    import pyarrow.parquet as pq
+
+    conn = get_snowflake_connection()
+    if conn is None:
+        if session_table:
+            session_table.log_message("Failed to connect to Snowflake", "ERROR")
+        return False
+
+    try:
+        schema = pq.read_schema(parquet_path)
+        columns_ddl = ", ".join(
+            f'"{field.name}" {_snowflake_type(field.type)}'
+            for field in schema
+        )
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} "
+                f'({columns_ddl}, "SELECTED_COUNTRY" VARCHAR)')
+        finally:
+            cursor.close()
+
+        _put_file(conn, parquet_path, table_name)
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                f"COPY INTO {table_name} "
+                "FILE_FORMAT=(TYPE=PARQUET) "
+                "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE PURGE=TRUE")
+            cursor.execute(
+                f'UPDATE {table_name} SET "SELECTED_COUNTRY" = %s',
+                (selected_country,))
+        finally:
+            cursor.close()
+        return True
+
+    except Exception as e:
+        logger.error(f"Error during staged Snowflake upload: {str(e)}")
+        if conn.is_closed():
+            _open_snowflake_connection.clear()
+        raise e
+
 
 def upload_original_data_to_snowflake(session_table, table_name_prefix="original_data"):
     """
@@ -81,27 +248,37 @@ def upload_original_data_to_snowflake(session_table, table_name_prefix="original
         
         # Get selected country
         selected_country = session_table.get_selected_country() or "unknown"
-        
-        # Create a copy of original data and add selected_country column
-        data_with_country = original_data.copy()
-        data_with_country['selected_country'] = selected_country
-        
+
         # Generate table name with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         table_name = f"{table_name_prefix}_{selected_country}_{timestamp}".upper()
-        
+
         result["table_name"] = table_name
-        result["rows_uploaded"] = len(data_with_country)
-        
+        result["rows_uploaded"] = len(original_data)
+
         session_table.log_message(f"Starting upload to table: {table_name}")
-        
-        # Upload the data with selected_country column
-        success = upload_dataframe_to_snowflake(data_with_country, table_name, session_table)
-        
+
+        # Prefer the Parquet file staged at parse time: same bytes, no
+        # re-serialization; the country column is filled in server-side
+        parquet_path = session_table.get_original_parquet_path()
+        if parquet_path and os.path.exists(parquet_path):
+            success = upload_staged_parquet_to_snowflake(
+                parquet_path, table_name, selected_country, session_table)
+            if success:
+                # PURGE only removes the stage-side copy; drop the local
+                # file too so pushes don't accumulate temp files
+                session_table.discard_original_parquet()
+        else:
+            # assign adds the country column while sharing the existing blocks
+            data_with_country = original_data.assign(
+                selected_country=selected_country)
+            success = upload_dataframe_to_snowflake(
+                data_with_country, table_name, session_table)
+
         if success:
             result["success"] = True
             result["upload_time"] = datetime.now()
-            result["message"] = f"Successfully uploaded {len(data_with_country)} rows to table: **{table_name}**"
+            result["message"] = f"Successfully uploaded {result['rows_uploaded']} rows to table: **{table_name}**"
             session_table.log_message(f"Upload completed successfully for table: {table_name}")
         else:
             result["message"] = "Upload to Snowflake failed. Please check the logs for details."
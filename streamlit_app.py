@@ -1,5 +1,5 @@
 import streamlit as st
-from src.data_handler import SessionTable
+from src.data_handler import get_session_table
 from src.shared_components import init_sidebar
 
 # Set page config - must be the first Streamlit command
@@ -12,7 +12,7 @@ st.set_page_config(
 
 # Initialize session table
 if "session_table" not in st.session_state:
-    st.session_state.session_table = SessionTable()
+    st.session_state.session_table = get_session_table()
 
 
 def main():
@@ -52,10 +52,10 @@ def main():
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            st.metric("📊 Total Rows", len(original_data))
+            st.metric("📊 Total Rows", original_data.shape[0])
 
         with col2:
-            st.metric("📋 Columns", len(original_data.columns))
+            st.metric("📋 Columns", original_data.shape[1])
 
         with col3:
             if session_table.is_validation_completed():